@@ -30,6 +30,7 @@ available (boolean) - True for products that are available for adoption
 """
 import logging
 from enum import Enum
+from functools import lru_cache
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
@@ -60,6 +61,12 @@ class Category(Enum):
     TOOLS = 5
 
 
+@lru_cache(maxsize=64)
+def _category_from_name(name: str) -> Category:
+    """Returns the Category for a name, caching the lookup"""
+    return getattr(Category, name)
+
+
 class Product(db.Model):
     """
     Class that represents a Product
@@ -142,7 +149,7 @@ class Product(db.Model):
                     "Invalid type for boolean [available]: "
                     + str(type(data["available"]))
                 )
-            self.category = getattr(Category, data["category"])  # create enum from string
+            self.category = _category_from_name(data["category"])  # create enum from string
         except AttributeError as error:
             raise DataValidationError("Invalid attribute: " + error.args[0]) from error
         except KeyError as error:
@@ -0,0 +1,88 @@
+######################################################################
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+"""
+Shared test fixtures
+
+The Flask app is configured for testing and the database schema is
+created once for the whole test session instead of once per test class
+
+The suite can also be spread over pytest-xdist workers, each with its
+own database that is dropped again when the run ends:
+    pytest -n auto --dist=loadfile
+"""
+import logging
+import pytest
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+from service import app
+from service.config import DATABASE_URI
+from service.models import db, init_db
+from tests.db_helpers import worker_database_uri, create_database, drop_database
+
+# Keep a warm pool and hand back the most recently used connection first
+ENGINE_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 10,
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+    "pool_use_lifo": True,
+}
+
+# Only psycopg2 understands this one: send executemany() batches as multi-row statements
+POSTGRES_ENGINE_OPTIONS = {"executemany_mode": "values_plus_batch"}
+
+
+def engine_options(uri: str) -> dict:
+    """Returns the engine options for the database in uri"""
+    if make_url(uri).get_backend_name() == "postgresql":
+        return {**ENGINE_OPTIONS, **POSTGRES_ENGINE_OPTIONS}
+    return ENGINE_OPTIONS
+
+
+# Set once the tables have been created in this process
+_SCHEMA_READY = False
+
+
+def init_test_db():
+    """Initializes the database, creating the schema only once per process"""
+    global _SCHEMA_READY  # pylint: disable=global-statement
+    if not _SCHEMA_READY:
+        init_db(app)
+        _SCHEMA_READY = True
+
+
+@pytest.fixture(scope="session", autouse=True)
+def configure_app():
+    """Configures the Flask app and database once for all test cases"""
+    database_uri = worker_database_uri(DATABASE_URI)
+    if database_uri != DATABASE_URI:
+        create_database(DATABASE_URI, database_uri)
+    app.config.update(
+        TESTING=True,
+        DEBUG=False,
+        SQLALCHEMY_DATABASE_URI=database_uri,
+        SQLALCHEMY_ENGINE_OPTIONS=engine_options(database_uri),
+    )
+    app.logger.setLevel(logging.CRITICAL)
+    init_test_db()
+    # Make sure the engine really was built with the options above
+    assert isinstance(db.engine.pool, QueuePool)
+    assert db.engine.pool.size() == ENGINE_OPTIONS["pool_size"]
+    yield
+    if database_uri != DATABASE_URI:
+        db.session.remove()
+        db.engine.dispose()
+        drop_database(DATABASE_URI, database_uri)
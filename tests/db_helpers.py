@@ -0,0 +1,102 @@
+######################################################################
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+######################################################################
+"""
+Database helpers for the test suite
+"""
+import os
+from unittest import TestCase
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import scoped_session, sessionmaker
+from service.models import db, Product
+
+
+def worker_database_uri(uri: str) -> str:
+    """Returns a database URI private to the current pytest-xdist worker
+
+    The database is named after the one in uri with the worker id appended.
+    Outside of pytest-xdist, or for a database other than PostgreSQL, the
+    URI is returned unchanged.
+    """
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    url = make_url(uri)
+    if not worker_id or not url.get_backend_name().startswith("postgresql"):
+        return uri
+    worker_url = url.set(database=f"{url.database}_{worker_id}")
+    return worker_url.render_as_string(hide_password=False)
+
+
+def _execute_autocommit(uri: str, statement: str):
+    """Runs a statement that cannot be run inside a transaction"""
+    engine = create_engine(uri, isolation_level="AUTOCOMMIT")
+    with engine.connect() as conn:
+        conn.execute(text(statement))
+    engine.dispose()
+
+
+def create_database(admin_uri: str, uri: str):
+    """Creates the database named in uri, connecting through admin_uri
+
+    A copy left over from an earlier run is dropped first, so the schema
+    always matches the current models.
+    """
+    drop_database(admin_uri, uri)
+    _execute_autocommit(admin_uri, f'CREATE DATABASE "{make_url(uri).database}"')
+
+
+def drop_database(admin_uri: str, uri: str):
+    """Drops the database named in uri, connecting through admin_uri"""
+    _execute_autocommit(admin_uri, f'DROP DATABASE IF EXISTS "{make_url(uri).database}" WITH (FORCE)')
+
+
+class DatabaseTestCase(TestCase):
+    """Base class for test cases that write to the database
+
+    Each test class runs inside one outer transaction that is never
+    committed, and each test inside a SAVEPOINT that is rolled back
+    afterwards. db.session is bound to that transaction, so session
+    commits (including the ones made by the routes) only release a
+    SAVEPOINT.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Begins the outer transaction and binds db.session to it"""
+        cls.connection = db.engine.connect()
+        cls.trans = cls.connection.begin()
+        cls.connection.execute(Product.__table__.delete())  # start with an empty table
+        cls.app_session = db.session
+        db.session = scoped_session(
+            sessionmaker(bind=cls.connection, join_transaction_mode="create_savepoint")
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        """Rolls back the outer transaction and restores db.session"""
+        db.session.close()
+        db.session = cls.app_session
+        cls.trans.rollback()
+        cls.connection.close()
+
+    def setUp(self):
+        """Begins the SAVEPOINT for this test"""
+        self.nested = self.connection.begin_nested()
+
+    def tearDown(self):
+        """Throws away everything the test wrote"""
+        # Ends the session's own SAVEPOINT; the class connection stays checked out
+        db.session.remove()
+        self.nested.rollback()